@@ -8,8 +8,9 @@
 from __future__ import annotations
 
 import ast
+from math import isfinite
 from operator import itemgetter
-from types import EllipsisType
+from textwrap import indent
 from typing import cast
 
 from apywire.constants import (
@@ -17,6 +18,7 @@ from apywire.constants import (
     PLACEHOLDER_REGEX,
     SYNTHETIC_CONST,
 )
+from apywire.exceptions import WiringError
 from apywire.wiring import (
     WiringBase,
     _AioWiredRef,
@@ -26,72 +28,18 @@ from apywire.wiring import (
     _WiredRef,
 )
 
-_PROPERTY_ARGS = ast.arguments(
-    posonlyargs=[],
-    args=[ast.arg(arg="self")],
-    vararg=None,
-    kwarg=None,
-    defaults=[],
-    kwonlyargs=[],
-    kw_defaults=[],
-)
+# Shared read-only AST template node, built once at import. ast.unparse
+# does not mutate input nodes, so one instance can safely appear in many
+# positions instead of being rebuilt per reference.
+_SELF_LOAD = ast.Name(id="self", ctx=ast.Load())
+
+# Fixed output for an empty spec without aio/thread_safe flavoring.
+_EMPTY_COMPILED_SRC = "class Compiled:\n    pass\ncompiled = Compiled()"
 
 
 class WiringCompiler(WiringBase):
     """Wiring container with compilation support."""
 
-    def _astify(self, obj: _ResolvedValue) -> ast.expr:
-        """Convert a Python object (possibly a `_WiredRef`) to AST.
-
-        Nested lists, tuples and dicts are supported. `_WiredRef` becomes
-        an accessor call (`self.<name>()`) to mirror runtime behavior.
-
-        `_AioWiredRef` becomes ``self.aio.<name>`` (an async accessor
-        attribute access, no call).
-        """
-        if isinstance(obj, _AioWiredRef):
-            # self.aio.name — attribute access, not a call
-            return ast.Attribute(
-                value=ast.Attribute(
-                    value=ast.Name(id="self", ctx=ast.Load()),
-                    attr="aio",
-                    ctx=ast.Load(),
-                ),
-                attr=obj.name,
-                ctx=ast.Load(),
-            )
-        if isinstance(obj, _WiredRef):
-            # Access the wired value via `self.name()` in compiled code.
-            return ast.Call(
-                func=ast.Attribute(
-                    value=ast.Name(id="self", ctx=ast.Load()),
-                    attr=obj.name,
-                    ctx=ast.Load(),
-                ),
-                args=[],
-                keywords=[],
-            )
-        if (
-            isinstance(obj, (str, bytes, bool, int, float, complex))
-            or obj is None
-            or isinstance(obj, EllipsisType)
-        ):
-            return ast.Constant(obj)
-        if isinstance(obj, dict):
-            keys = [ast.Constant(k) for k in obj.keys()]
-            values = [self._astify(v) for v in obj.values()]
-            return ast.Dict(
-                keys=cast(list[ast.expr | None], keys),
-                values=values,
-            )
-        if isinstance(obj, list):
-            elts = [self._astify(v) for v in obj]
-            return ast.List(elts=elts, ctx=ast.Load())
-        if isinstance(obj, tuple):
-            elts = [self._astify(v) for v in obj]
-            return ast.Tuple(elts=elts, ctx=ast.Load())
-        return ast.Constant(cast(_ConstantValue, obj))
-
     def _normalize_spec_data(
         self, data: _ResolvedSpecMapping
     ) -> tuple[list[_ResolvedValue], dict[str, _ResolvedValue]]:
@@ -124,104 +72,72 @@ class WiringCompiler(WiringBase):
 
         return args_data, kwargs_data
 
-    def _process_argument_values(
-        self,
-        args_data: list[_ResolvedValue],
-        kwargs_data: dict[str, _ResolvedValue],
-    ) -> tuple[list[ast.expr], list[ast.keyword]]:
-        """Process argument values and return AST expressions.
-
-        Args:
-            args_data: List of positional argument values
-            kwargs_data: Dict of keyword argument values
+    def _expr_source(self, obj: _ResolvedValue) -> str:
+        """Render a resolved value as Python source.
 
-        Returns:
-            Tuple of (args_list, kwargs_list) with AST expressions
+        `_WiredRef` becomes ``self.name()``, `_AioWiredRef` becomes
+        ``self.aio.name``, containers recurse (subclasses render as
+        plain literals), and constants use their repr (with Ellipsis
+        spelled ``...`` and non-finite numbers as constructor calls so
+        they parse back to the same value). Anything unrenderable
+        raises instead of silently emitting source that cannot execute.
         """
-        args: list[ast.expr] = []
-        kwargs: list[ast.keyword] = []
-
-        for value in args_data:
-            args.append(self._astify(value))
-
-        for key, value in kwargs_data.items():
-            kwargs.append(ast.keyword(arg=key, value=self._astify(value)))
-
-        return args, kwargs
-
-    def _create_module_reference(
-        self, module_name: str, class_name: str, factory_method: str | None
-    ) -> ast.expr:
-        """Create AST reference to module.Class or module.Class.method."""
-        if factory_method:
-            return ast.Attribute(
-                value=ast.Attribute(
-                    value=ast.Name(id=module_name, ctx=ast.Load()),
-                    attr=class_name,
-                    ctx=ast.Load(),
-                ),
-                attr=factory_method,
-                ctx=ast.Load(),
-            )
-        else:
-            return ast.Attribute(
-                value=ast.Name(id=module_name, ctx=ast.Load()),
-                attr=class_name,
-                ctx=ast.Load(),
+        t = type(obj)
+        if t is _WiredRef:
+            return f"self.{cast(_WiredRef, obj).name}()"
+        if t is _AioWiredRef:
+            return f"self.aio.{cast(_AioWiredRef, obj).name}"
+        if t is dict:
+            d = cast("dict[str | int, _ResolvedValue]", obj)
+            items = ", ".join(
+                f"{k!r}: {self._expr_source(v)}" for k, v in d.items()
             )
-
-    def _create_cache_check(self, cache_attr: str) -> ast.expr:
-        """Create hasattr check for cache attribute."""
-        return ast.UnaryOp(
-            op=ast.Not(),
-            operand=ast.Call(
-                func=ast.Name(id="hasattr", ctx=ast.Load()),
-                args=[
-                    ast.Name(id="self", ctx=ast.Load()),
-                    ast.Constant(value=cache_attr),
-                ],
-                keywords=[],
-            ),
-        )
-
-    def _create_return_statement(self, cache_attr: str) -> ast.stmt:
-        """Create return statement for cached value."""
-        return ast.Return(
-            value=ast.Attribute(
-                value=ast.Name(id="self", ctx=ast.Load()),
-                attr=cache_attr,
-                ctx=ast.Load(),
+            return "{" + items + "}"
+        if t is list:
+            ls = cast("list[_ResolvedValue]", obj)
+            return "[" + ", ".join(map(self._expr_source, ls)) + "]"
+        if t is tuple:
+            tp = cast("tuple[_ResolvedValue, ...]", obj)
+            if len(tp) == 1:
+                return "(" + self._expr_source(tp[0]) + ",)"
+            return "(" + ", ".join(map(self._expr_source, tp)) + ")"
+        if obj is ...:
+            return "..."
+        if isinstance(obj, float) and not isfinite(obj):
+            # repr() renders non-finite floats as inf/-inf/nan, which
+            # read back as unbound names rather than constants; spell
+            # them as float() calls that parse to the same value.
+            return f'float("{obj!r}")'
+        if isinstance(obj, complex) and not (
+            isfinite(obj.real) and isfinite(obj.imag)
+        ):
+            # Same problem for complex: rebuild from the component
+            # floats so non-finite parts round-trip through source.
+            real = self._expr_source(obj.real)
+            imag = self._expr_source(obj.imag)
+            return f"complex({real}, {imag})"
+        if obj is None or isinstance(
+            obj, (str, bytes, bool, int, float, complex)
+        ):
+            return repr(obj)
+        # Exact-type misses: container subclasses (rare) render as plain
+        # literals, mirroring the isinstance fallback in _resolve.
+        if isinstance(obj, dict):
+            items = ", ".join(
+                f"{k!r}: {self._expr_source(v)}" for k, v in obj.items()
             )
-        )
-
-    def _create_cache_assignment(
-        self, cache_attr: str, value_expr: ast.expr
-    ) -> ast.stmt:
-        """Create assignment to cache attribute."""
-        return ast.Assign(
-            targets=[
-                ast.Attribute(
-                    value=ast.Name(id="self", ctx=ast.Load()),
-                    attr=cache_attr,
-                    ctx=ast.Store(),
-                )
-            ],
-            value=value_expr,
-        )
-
-    def _create_lambda_function(self, body: ast.expr) -> ast.Lambda:
-        """Create a lambda function with the given body."""
-        return ast.Lambda(
-            args=ast.arguments(
-                posonlyargs=[],
-                args=[],
-                vararg=None,
-                kwarg=None,
-                defaults=[],
-                kwonlyargs=[],
-                kw_defaults=[],
-            ),
-            body=body,
+            return "{" + items + "}"
+        if isinstance(obj, list):
+            return "[" + ", ".join(map(self._expr_source, obj)) + "]"
+        if isinstance(obj, tuple):
+            if len(obj) == 1:
+                return "(" + self._expr_source(obj[0]) + ",)"
+            return "(" + ", ".join(map(self._expr_source, obj)) + ")"
+        # An object repr() cannot round-trip: emitting it would produce
+        # a module that fails at exec or call time, so fail the compile
+        # instead.
+        raise WiringError(
+            f"cannot render {type(obj).__name__} value as source"
         )
 
     def _compile_property(
@@ -233,90 +149,56 @@ class WiringCompiler(WiringBase):
         data: _ResolvedSpecMapping,
         *,
         thread_safe: bool = False,
-    ) -> ast.FunctionDef:
-        """Build an AST FunctionDef for a cached accessor that returns
+    ) -> str:
+        """Render the source of a cached accessor that returns
         ``module.class(**data)`` or ``module.class.factory_method(**data)``.
+
+        The accessor is a pure f-string template (unindented; the
+        caller indents it into the class body), so no AST work happens
+        at all for the stereotyped property shape.
         """
         # Build the target callable: module.Class or module.Class.factoryMethod
-        module_attr = self._create_module_reference(
-            module_name, class_name, factory_method
-        )
+        target = f"{module_name}.{class_name}"
+        if factory_method:
+            target = f"{target}.{factory_method}"
 
-        # Normalize and process argument data
+        # Normalize argument data and render the constructor call
         args_data, kwargs_data = self._normalize_spec_data(data)
-        args, kwargs = self._process_argument_values(
-            args_data,
-            kwargs_data,
+        arg_parts = [self._expr_source(v) for v in args_data]
+        arg_parts.extend(
+            f"{key}={self._expr_source(v)}" for key, v in kwargs_data.items()
         )
-
-        call = ast.Call(func=module_attr, args=args, keywords=kwargs)
+        call_src = f"{target}({', '.join(arg_parts)})"
 
         cache_attr = f"{CACHE_ATTR_PREFIX}{name}"
 
-        # Create reusable components
-        has_check = self._create_cache_check(cache_attr)
-        return_stmt = self._create_return_statement(cache_attr)
-
         if not thread_safe:
-            assign_cache = self._create_cache_assignment(cache_attr, call)
-            if_stmt = ast.If(test=has_check, body=[assign_cache], orelse=[])
-            func_def = ast.FunctionDef(
-                name=name,
-                args=_PROPERTY_ARGS,
-                body=[if_stmt, return_stmt],
-                decorator_list=[],
-                returns=None,
-                type_comment=None,
-                type_params=[],
-            )
+            value_src = call_src
         else:
-            # Build sync thread-safe version using helper mixin
-            maker = self._create_lambda_function(call)
-            call_inst = ast.Call(
-                func=ast.Attribute(
-                    value=ast.Name(id="self", ctx=ast.Load()),
-                    attr="_instantiate_attr",
-                    ctx=ast.Load(),
-                ),
-                args=[ast.Constant(value=name), maker],
-                keywords=[],
-            )
-            assign_cache = self._create_cache_assignment(cache_attr, call_inst)
-            func_def = ast.FunctionDef(
-                name=name,
-                args=_PROPERTY_ARGS,
-                body=[
-                    ast.If(
-                        test=has_check,
-                        body=[assign_cache],
-                        orelse=[],
-                    ),
-                    return_stmt,
-                ],
-                decorator_list=[],
-                returns=None,
-                type_comment=None,
-                type_params=[],
-            )
-        return func_def
+            # Thread-safe version instantiates via the helper mixin
+            value_src = f"self._instantiate_attr({name!r}, lambda: {call_src})"
+
+        # EAFP cache check: hasattr() performs a full attribute lookup
+        # (and swallows an AttributeError) before the real load, so the
+        # cached path paid for two lookups. With try/except the cached
+        # path is a single C-level fetch, and zero-cost exceptions make
+        # the one-time miss no slower.
+        return (
+            f"def {name}(self):\n"
+            f"    try:\n"
+            f"        return self.{cache_attr}\n"
+            f"    except AttributeError:\n"
+            f"        self.{cache_attr} = {value_src}\n"
+            f"        return self.{cache_attr}\n"
+        )
 
     def _compile_constant_property(
         self,
         name: str,
         value: _ConstantValue,
-    ) -> ast.FunctionDef:
-        """Return an AST FunctionDef for an accessor that returns a
-        constant value.
-        """
-        return ast.FunctionDef(
-            name=name,
-            args=_PROPERTY_ARGS,
-            body=[ast.Return(value=ast.Constant(value))],
-            decorator_list=[],
-            returns=None,
-            type_comment=None,
-            type_params=[],
-        )
+    ) -> str:
+        """Render the source of an accessor that returns a constant."""
+        return f"def {name}(self):\n    return {self._expr_source(value)}\n"
 
     def _astify_interpolated_string(self, template: str) -> ast.expr:
         """Build an AST f-string from a template with placeholders.
@@ -335,7 +217,7 @@ class WiringCompiler(WiringBase):
             ref_name = match.group(1)
             accessor_call = ast.Call(
                 func=ast.Attribute(
-                    value=ast.Name(id="self", ctx=ast.Load()),
+                    value=_SELF_LOAD,
                     attr=ref_name,
                     ctx=ast.Load(),
                 ),
@@ -366,8 +248,8 @@ class WiringCompiler(WiringBase):
         data: _ResolvedValue,
         *,
         thread_safe: bool = False,
-    ) -> ast.FunctionDef:
-        """Build an AST FunctionDef for an auto-promoted constant.
+    ) -> str:
+        """Render the source of an auto-promoted constant accessor.
 
         Auto-promoted constants are values (strings, lists, dicts)
         that reference wired objects via placeholders. They are
@@ -375,62 +257,30 @@ class WiringCompiler(WiringBase):
         call time.
         """
         if isinstance(data, str):
-            value_expr = self._astify_interpolated_string(data)
+            # Interpolated templates become f-strings; build the tiny
+            # expression node and let ast.unparse handle the escaping
+            # of literal text inside the f-string.
+            value_src = ast.unparse(self._astify_interpolated_string(data))
         else:
-            value_expr = self._astify(data)
+            value_src = self._expr_source(data)
         cache_attr = f"{CACHE_ATTR_PREFIX}{name}"
-        has_check = self._create_cache_check(cache_attr)
-        return_stmt = self._create_return_statement(cache_attr)
 
-        if not thread_safe:
-            assign_cache = self._create_cache_assignment(
-                cache_attr, value_expr
-            )
-            return ast.FunctionDef(
-                name=name,
-                args=_PROPERTY_ARGS,
-                body=[
-                    ast.If(
-                        test=has_check,
-                        body=[assign_cache],
-                        orelse=[],
-                    ),
-                    return_stmt,
-                ],
-                decorator_list=[],
-                returns=None,
-                type_comment=None,
-                type_params=[],
-            )
-        else:
-            maker = self._create_lambda_function(value_expr)
-            call_inst = ast.Call(
-                func=ast.Attribute(
-                    value=ast.Name(id="self", ctx=ast.Load()),
-                    attr="_instantiate_attr",
-                    ctx=ast.Load(),
-                ),
-                args=[ast.Constant(value=name), maker],
-                keywords=[],
-            )
-            assign_cache = self._create_cache_assignment(cache_attr, call_inst)
-            return ast.FunctionDef(
-                name=name,
-                args=_PROPERTY_ARGS,
-                body=[
-                    ast.If(
-                        test=has_check,
-                        body=[assign_cache],
-                        orelse=[],
-                    ),
-                    return_stmt,
-                ],
-                decorator_list=[],
-                returns=None,
-                type_comment=None,
-                type_params=[],
+        if thread_safe:
+            value_src = (
+                f"self._instantiate_attr({name!r}, lambda: {value_src})"
             )
 
+        # Same EAFP shape as _compile_property: one C-level fetch on the
+        # cached path instead of hasattr's probe-plus-load.
+        return (
+            f"def {name}(self):\n"
+            f"    try:\n"
+            f"        return self.{cache_attr}\n"
+            f"    except AttributeError:\n"
+            f"        self.{cache_attr} = {value_src}\n"
+            f"        return self.{cache_attr}\n"
+        )
+
     def compile(self, *, aio: bool = False, thread_safe: bool = False) -> str:
         """Compiles the Spec into a string containing Python code.
 
@@ -446,114 +296,74 @@ class WiringCompiler(WiringBase):
             A string containing the Python source for the compiled
             `Compiled` container.
         """
-        # Build AST for the module
-        body: list[ast.stmt] = []
-
-        # Add import statements
-        modules = set()
-        for module_name, _, _, _ in self._parsed.values():
-            # Skip the synthetic __sconst__ module (SYNTHETIC_CONST)
-            if module_name != SYNTHETIC_CONST:
-                modules.add(module_name)
+        # The output is highly templated (imports, one class, N
+        # stereotyped accessors), so it is assembled directly from
+        # source fragments: no module AST is built and ast.unparse's
+        # per-node visitor dispatch is skipped entirely.
+        # Bind the hot instance attributes once: the loops below then do
+        # LOAD_FAST instead of a LOAD_ATTR dict probe per iteration.
+        parsed = self._parsed
+        values = self._values
+
+        # An empty spec with no flags always produces the same module.
+        if not parsed and not values and not aio and not thread_safe:
+            return _EMPTY_COMPILED_SRC
+
+        import_lines: list[str] = []
+
+        # Add import statements. The thread-safety primitives are a fixed
+        # prelude rather than members of the sorted pass, which drops the
+        # per-module special-case branching; dict.fromkeys deduplicates
+        # the parsed modules in one pass.
         if thread_safe:
-            # When compiling thread_safe, import thread-safety primitives
-            modules.add("apywire.threads")
-            modules.add("apywire.exceptions")
-        for module in sorted(modules):
-            if module == "apywire.threads":
-                # Import ThreadSafeMixin from threads
-                body.append(
-                    ast.ImportFrom(
-                        module="apywire.threads",
-                        names=[
-                            ast.alias(name="ThreadSafeMixin"),
-                        ],
-                        level=0,
-                    )
-                )
-            elif module == "apywire.exceptions":
-                # Import LockUnavailableError from exceptions
-                body.append(
-                    ast.ImportFrom(
-                        module="apywire.exceptions",
-                        names=[
-                            ast.alias(name="LockUnavailableError"),
-                        ],
-                        level=0,
-                    )
-                )
-            else:
-                body.append(ast.Import(names=[ast.alias(name=module)]))
-        if aio:
-            # from functools import cached_property
-            body.append(
-                ast.ImportFrom(
-                    module="functools",
-                    names=[ast.alias(name="cached_property")],
-                    level=0,
-                )
-            )
-            # from apywire.runtime import CompiledAio
-            body.append(
-                ast.ImportFrom(
-                    module="apywire.runtime",
-                    names=[ast.alias(name="CompiledAio")],
-                    level=0,
-                )
+            import_lines.append(
+                "from apywire.exceptions import LockUnavailableError"
             )
+            import_lines.append("from apywire.threads import ThreadSafeMixin")
+        modules: dict[str, None] = dict.fromkeys(
+            entry.module_name
+            for entry in parsed.values()
+            # Skip the synthetic __sconst__ module (SYNTHETIC_CONST)
+            if entry.module_name != SYNTHETIC_CONST
+        )
+        import_lines.extend(f"import {module}" for module in sorted(modules))
+        if aio:
+            import_lines.append("from functools import cached_property")
+            import_lines.append("from apywire.runtime import CompiledAio")
 
-        # Build class body
-        class_body: list[ast.stmt] = []
+        # Build class members (each an unindented def/decorated block)
+        members: list[str] = []
 
         # Collect constants for pre-caching (aio needs cache attrs)
         constant_names: dict[str, _ConstantValue] = {}
         if aio:
-            for cname, cvalue in self._values.items():
-                if cname not in self._parsed:
+            for cname, cvalue in values.items():
+                if cname not in parsed:
                     constant_names[cname] = cast(_ConstantValue, cvalue)
 
         # Generate __init__ if needed (thread_safe or aio constants)
-        init_body: list[ast.stmt] = []
+        init_lines: list[str] = []
         if thread_safe:
-            init_body.append(
-                ast.Expr(
-                    value=ast.Call(
-                        func=ast.Attribute(
-                            value=ast.Name(id="self", ctx=ast.Load()),
-                            attr="_init_thread_safety",
-                            ctx=ast.Load(),
-                        ),
-                        args=[],
-                        keywords=[],
-                    ),
-                )
-            )
+            init_lines.append("self._init_thread_safety()")
         # Pre-populate cache attributes for constants so CompiledAio
         # can find them without going through run_in_executor.
         for cname, cvalue in constant_names.items():
-            cache_attr = f"{CACHE_ATTR_PREFIX}{cname}"
-            init_body.append(
-                self._create_cache_assignment(cache_attr, ast.Constant(cvalue))
-            )
-        if init_body:
-            init_def = ast.FunctionDef(
-                name="__init__",
-                args=_PROPERTY_ARGS,
-                body=init_body,
-                decorator_list=[],
-                returns=None,
-                type_params=[],
+            init_lines.append(
+                f"self.{CACHE_ATTR_PREFIX}{cname}"
+                f" = {self._expr_source(cvalue)}"
             )
-            class_body.insert(0, init_def)
+        if init_lines:
+            init_body = "".join(f"    {line}\n" for line in init_lines)
+            members.append(f"def __init__(self):\n{init_body}")
 
-        for name, entry in self._parsed.items():
+        for name, entry in parsed.items():
             if (
                 entry.module_name == SYNTHETIC_CONST
                 and entry.class_name == "str"
             ):
                 # Auto-promoted constant with wired refs.
                 # Compile as a cached accessor that resolves refs.
-                class_body.append(
+                members.append(
                     self._compile_promoted_constant(
                         name,
                         entry.data,
@@ -562,7 +372,7 @@ class WiringCompiler(WiringBase):
                 )
                 continue
 
-            class_body.append(
+            members.append(
                 self._compile_property(
                     name,
                     entry.module_name,
@@ -574,10 +384,10 @@ class WiringCompiler(WiringBase):
             )
 
         # Add constant accessors (names present in _values but not in parsed)
-        for name, value in self._values.items():
-            if name in self._parsed:
+        for name, value in values.items():
+            if name in parsed:
                 continue
-            class_body.append(
+            members.append(
                 self._compile_constant_property(
                     name,
                     cast(_ConstantValue, value),
@@ -586,61 +396,25 @@ class WiringCompiler(WiringBase):
 
         # When aio=True, append .aio cached property
         if aio:
-            # @cached_property
-            # def aio(self):
-            #     return CompiledAio(self)
-            aio_prop = ast.FunctionDef(
-                name="aio",
-                args=_PROPERTY_ARGS,
-                body=[
-                    ast.Return(
-                        value=ast.Call(
-                            func=ast.Name(id="CompiledAio", ctx=ast.Load()),
-                            args=[
-                                ast.Name(id="self", ctx=ast.Load()),
-                            ],
-                            keywords=[],
-                        )
-                    )
-                ],
-                decorator_list=[
-                    ast.Name(id="cached_property", ctx=ast.Load()),
-                ],
-                returns=None,
-                type_comment=None,
-                type_params=[],
+            members.append(
+                "@cached_property\n"
+                "def aio(self):\n"
+                "    return CompiledAio(self)\n"
             )
-            class_body.append(aio_prop)
-
-        class_body = [ast.Pass()] if not class_body else class_body
-        # Build class definition
-        class_bases: list[ast.expr] = []
-        if thread_safe:
-            class_bases.append(ast.Name(id="ThreadSafeMixin", ctx=ast.Load()))
-        class_def = ast.ClassDef(
-            name="Compiled",
-            bases=class_bases,
-            keywords=[],
-            body=class_body,
-            decorator_list=[],
-            type_params=[],
-        )
-        body.append(class_def)
-
-        # Add compiled = Compiled()
-        assign = ast.Assign(
-            targets=[ast.Name(id="compiled", ctx=ast.Store())],
-            value=ast.Call(
-                func=ast.Name(id="Compiled", ctx=ast.Load()),
-                args=[],
-                keywords=[],
-            ),
-        )
-        body.append(assign)
-
-        # Create module AST
-        module_ast = ast.Module(body=body, type_ignores=[])
-        ast.fix_missing_locations(module_ast)
 
-        # Unparse to string
-        return ast.unparse(module_ast)
+        # Assemble the module: imports, class definition, instance.
+        parts: list[str] = []
+        if import_lines:
+            parts.append("\n".join(import_lines))
+            parts.append("\n\n")
+        bases = "(ThreadSafeMixin)" if thread_safe else ""
+        parts.append(f"class Compiled{bases}:\n")
+        if members:
+            parts.append("\n")
+            parts.append(
+                "\n".join(indent(member, "    ") for member in members)
+            )
+        else:
+            parts.append("    pass\n")
+        parts.append("compiled = Compiled()")
+        return "".join(parts)
@@ -9,22 +9,27 @@ to improve maintainability and reduce duplication.
 """
 
 import re
+from typing import Final
 
-SPEC_KEY_DELIMITER = " "  # Separates module.Class from name in spec keys
+# All constants are Final: initialized exactly once at import (Python's
+# lock-free equivalent of the initialization-on-demand holder idiom) and
+# never rebound, which also lets type checkers treat reads as constants.
 
-PLACEHOLDER_START = "{"  # Start marker for placeholder references
-PLACEHOLDER_END = "}"  # End marker for placeholder references
+SPEC_KEY_DELIMITER: Final = " "  # Separates module.Class from name in keys
+
+PLACEHOLDER_START: Final = "{"  # Start marker for placeholder references
+PLACEHOLDER_END: Final = "}"  # End marker for placeholder references
 
 # Regex pattern for placeholders like {name}: captures name, no nested braces
-PLACEHOLDER_PATTERN = r"\{([^{}]+)\}"
+PLACEHOLDER_PATTERN: Final = r"\{([^{}]+)\}"
 # Compiled version for better performance
-PLACEHOLDER_REGEX = re.compile(PLACEHOLDER_PATTERN)
+PLACEHOLDER_REGEX: Final = re.compile(PLACEHOLDER_PATTERN)
 
-SYNTHETIC_CONST = "__sconst__"  # Synthetic module for promoted constants
+SYNTHETIC_CONST: Final = "__sconst__"  # Synthetic module, promoted constants
 
-CACHE_ATTR_PREFIX = "_"  # Prefix for cache attributes (_name)
+CACHE_ATTR_PREFIX: Final = "_"  # Prefix for cache attributes (_name)
 
 # Thread-safety defaults: max retries and per-retry sleep when falling back
 # to the global lock in thread_safe mode.
-DEFAULT_MAX_LOCK_ATTEMPTS = 10
-DEFAULT_LOCK_RETRY_SLEEP = 0.01
+DEFAULT_MAX_LOCK_ATTEMPTS: Final = 10
+DEFAULT_LOCK_RETRY_SLEEP: Final = 0.01
@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import importlib
 import re
+import threading
 from functools import cached_property
 from operator import itemgetter
 from typing import Awaitable, Callable, Protocol, cast, final
@@ -46,6 +47,11 @@ __all__ = [
 ]
 
 
+# Sentinel distinguishing "cached as None/falsy" from "not cached" so hot
+# paths can use a single dict.get probe instead of `in` + `[]`.
+_MISSING: object = object()
+
+
 class _Constructor(Protocol):
     """Protocol for callable constructors.
 
@@ -90,6 +96,13 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
         )
         if self._thread_safe:
             self._init_thread_safety(max_lock_attempts, lock_retry_sleep)
+        # Resolved constructors keyed by (module, class, factory method).
+        # importlib.import_module takes the import lock and re-walks dotted
+        # names on every call; entries sharing a class resolve it once here.
+        # Plain dict get/set are GIL-atomic, so no extra locking is needed.
+        self._constructor_cache: dict[
+            tuple[str, str, str | None], _Constructor
+        ] = {}
 
     def _init_thread_safety(
         self,
@@ -100,6 +113,11 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
         ThreadSafeMixin._init_thread_safety(
             self, max_lock_attempts, lock_retry_sleep
         )
+        # The entry set is fixed after parsing, so preallocate one lock per
+        # entry now; every _get_attribute_lock call then resolves through
+        # the lock-free dict read instead of the creation mutex.
+        for name in self._parsed:
+            self._attr_locks[name] = threading.RLock()
 
     def __getattr__(self, name: str) -> Accessor:
         """Return a callable accessor for the named wired object."""
@@ -127,8 +145,16 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
                 f"'{type(self).__name__}' object has no attribute '{name}'"
             ) from None
         # If the name is in our parsed spec or constants, return an accessor.
+        # The accessor is stored as a real instance attribute: __getattr__
+        # only fires when normal lookup fails, so after the first miss every
+        # later `wiring.name` is served by the C-level __getattribute__ fast
+        # path and this method never runs again for that name. Shadowing a
+        # real method is impossible for the same reason -- a name that
+        # resolves normally never reaches this code.
         if name in parsed or name in values:
-            return Accessor(self, name)
+            accessor = Accessor(self, name)
+            object.__setattr__(self, name, accessor)
+            return accessor
         raise AttributeError(
             f"'{type(self).__name__}' object has no attribute '{name}'"
         )
@@ -143,6 +169,37 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
         """
         return AioAccessor(self)
 
+    def _access_value(self, name: str) -> _RuntimeValue:
+        """Return the runtime value for a known name.
+
+        This is the work behind an accessor call, reachable without the
+        __getattr__/Accessor dispatch: a cached-value fast path, then
+        instantiation via the configured strategy.
+        """
+        # Fast path: EAFP pattern for cache lookup. This read runs before
+        # any lock is taken, which is safe even in thread-safe mode:
+        # _values entries are write-once (a name is never re-assigned after
+        # instantiation) and dict reads are GIL-atomic, so a hit here can
+        # never observe a torn or stale value.
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        return self._instantiate_attr(
+            name, lambda: self._instantiate_impl(name)
+        )
+
+    def prebuild(self) -> None:
+        """Eagerly instantiate every entry, dependencies first.
+
+        Walks the dependency order computed at construction time, so by
+        the time an entry is built everything it references already sits
+        in the value cache and each of its refs resolves with a single
+        dict probe. After a prebuild, every accessor call is a cache hit.
+        """
+        for name in self._build_order:
+            self._access_value(name)
+
     def _instantiate_attr(
         self,
         name: str,
@@ -159,8 +216,9 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
             return ThreadSafeMixin._instantiate_attr(self, name, maker)
 
         # Non-thread-safe path: simple check and set
-        if name in self._values:
-            return self._values[name]
+        cached_value = self._values.get(name, _MISSING)
+        if cached_value is not _MISSING:
+            return cached_value
 
         # No locking needed
         val = maker()
@@ -209,8 +267,9 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
         "module.Class instance.from_date"), the factory method is called
         instead of the class constructor.
         """
-        if name in self._values:
-            return self._values[name]
+        cached_value = self._values.get(name, _MISSING)
+        if cached_value is not _MISSING:
+            return cached_value
 
         if name not in self._parsed:
             # Should have been caught by __getattr__ or _resolve_runtime,
@@ -238,25 +297,41 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
         # class or factory method) is wrapped with this attribute's name.
         # Wrapping these consistently makes thread-safe and non-thread-safe
         # modes report identical errors for every failure mode.
-        try:
-            module = importlib.import_module(entry.module_name)
-            cls = cast(_Constructor, getattr(module, entry.class_name))
-
-            # If a factory method is specified, get it from the class
-            if entry.factory_method:
-                constructor = cast(
-                    _Constructor, getattr(cls, entry.factory_method)
-                )
-            else:
-                constructor = cls
-        except Exception as e:
-            raise WiringError(f"failed to instantiate '{name}': {e}") from e
+        cache_key = (
+            entry.module_name,
+            entry.class_name,
+            entry.factory_method,
+        )
+        cached = self._constructor_cache.get(cache_key)
+        if cached is not None:
+            constructor = cached
+        else:
+            try:
+                module = importlib.import_module(entry.module_name)
+                cls = cast(_Constructor, getattr(module, entry.class_name))
+
+                # If a factory method is specified, get it from the class
+                if entry.factory_method:
+                    constructor = cast(
+                        _Constructor, getattr(cls, entry.factory_method)
+                    )
+                else:
+                    constructor = cls
+            except Exception as e:
+                raise WiringError(
+                    f"failed to instantiate '{name}': {e}"
+                ) from e
+            self._constructor_cache[cache_key] = constructor
 
         # Resolve arguments. Nested instantiation failures surface here as
         # WiringErrors that already name the dependency that failed; let them
         # propagate unchanged rather than re-wrapping them with this
-        # attribute's name (which would bury the real origin).
-        kwargs = self._resolve_runtime(entry.data, context=name)
+        # attribute's name (which would bury the real origin). Entries whose
+        # data was proven placeholder-free at parse time skip the walk.
+        if entry.has_refs:
+            kwargs = self._resolve_runtime(entry.data, context=name)
+        else:
+            kwargs = cast(_RuntimeValue, entry.data)
 
         try:
             if isinstance(kwargs, dict):
@@ -294,25 +369,113 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
             return self.aio.__getattr__(o.name)
 
         if isinstance(o, _WiredRef):
+            # Single-probe fast path for already-built values; the `in`
+            # check plus the later cache read would hash the name twice.
+            cached_value = self._values.get(o.name, _MISSING)
+            if cached_value is not _MISSING:
+                return cached_value
             # Ensure placeholder was defined in spec
-            if o.name not in self._values and o.name not in self._parsed:
+            if o.name not in self._parsed:
                 ctx = f" while instantiating '{context}'" if context else ""
                 raise UnknownPlaceholderError(
                     f"Unknown placeholder '{o.name}' referenced{ctx}."
                 )
-            # Membership check ensures `o.name` is known; if getattr raises
-            # AttributeError it's from instance creation — let it propagate.
-            # Call the accessor `self.name()` to get the runtime value.
-            return cast(object, getattr(self, o.name)())
-
-        elif isinstance(o, dict):
-            return {k: self._resolve_runtime(v, context) for k, v in o.items()}
-        elif isinstance(o, list):
-            return [self._resolve_runtime(v, context) for v in o]
-        elif isinstance(o, tuple):
-            return tuple(self._resolve_runtime(v, context) for v in o)
+            # Membership check ensures `o.name` is known. Dispatch straight
+            # to the access implementation: going through getattr would
+            # re-run __getattr__'s membership checks and Accessor.__call__
+            # for a name that was just validated.
+            return self._access_value(o.name)
+
+        elif isinstance(o, (dict, list, tuple)):
+            # Constant subtrees carry no markers; hand the original
+            # container back instead of rebuilding an identical copy. The
+            # containment scan is a cheap flat walk, while rebuilding
+            # allocates a fresh container per level on every instantiation.
+            if not self._contains_wired_ref(o):
+                return cast(_RuntimeValue, o)
+            return self._resolve_runtime_container(o, context)
         return o
 
+    def _resolve_runtime_container(
+        self,
+        obj: _ResolvedValue,
+        context: str | None,
+    ) -> _RuntimeValue:
+        """Rebuild a marker-bearing container with refs resolved.
+
+        Mirrors the explicit work-stack walk of ``Wiring._resolve``:
+        no Python frame per nesting level, pre-sized list shadows
+        filled by slot, and deferred dict/tuple conversions applied
+        deepest-first. Marker-free branches are assigned back by
+        reference instead of being copied.
+        """
+        root: list[_RuntimeValue] = [None]
+        stack: list[tuple[_ResolvedValue, list[_RuntimeValue], int]] = [
+            (obj, root, 0)
+        ]
+        # Deferred conversions: (parent, slot, shadow, keys) where keys
+        # is the ordered key tuple for dicts and None for tuples.
+        fixups: list[
+            tuple[
+                list[_RuntimeValue],
+                int,
+                list[_RuntimeValue],
+                tuple[str | int, ...] | None,
+            ]
+        ] = []
+
+        while stack:
+            src, parent, slot = stack.pop()
+            if isinstance(src, dict):
+                if not self._contains_wired_ref(src):
+                    parent[slot] = cast(_RuntimeValue, src)
+                    continue
+                shadow: list[_RuntimeValue] = [None] * len(src)
+                fixups.append((parent, slot, shadow, tuple(src.keys())))
+                stack.extend(
+                    (v, shadow, i) for i, v in enumerate(src.values())
+                )
+            elif isinstance(src, list):
+                if not self._contains_wired_ref(src):
+                    parent[slot] = cast(_RuntimeValue, src)
+                    continue
+                shadow = [None] * len(src)
+                parent[slot] = shadow
+                stack.extend((v, shadow, i) for i, v in enumerate(src))
+            elif isinstance(src, tuple):
+                if not self._contains_wired_ref(src):
+                    parent[slot] = cast(_RuntimeValue, src)
+                    continue
+                shadow = [None] * len(src)
+                fixups.append((parent, slot, shadow, None))
+                stack.extend((v, shadow, i) for i, v in enumerate(src))
+            else:
+                # Leaves (refs included) go through the main dispatcher.
+                parent[slot] = self._resolve_runtime(src, context)
+
+        # Shadows were recorded top-down, so the reverse order finishes
+        # children before the containers that hold them.
+        for parent, slot, shadow, keys in reversed(fixups):
+            if keys is None:
+                parent[slot] = tuple(shadow)
+            else:
+                parent[slot] = dict(zip(keys, shadow))
+        return root[0]
+
+    @staticmethod
+    def _contains_wired_ref(o: _ResolvedValue) -> bool:
+        """Whether any wired-ref marker appears anywhere in the subtree."""
+        stack: list[_ResolvedValue] = [o]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, (_WiredRef, _AioWiredRef)):
+                return True
+            if isinstance(current, dict):
+                stack.extend(current.values())
+            elif isinstance(current, (list, tuple)):
+                stack.extend(current)
+        return False
+
     def _format_string_constant(
         self, template: _ResolvedValue, context: str
     ) -> str:
@@ -354,8 +517,9 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
                     f"in auto-promoted constant '{context}'"
                 )
 
-            # Get the value (instantiate if needed via accessor)
-            value = cast(object, getattr(self, ref_name)())
+            # Get the value (instantiate if needed), bypassing accessor
+            # dispatch -- the name was just validated above.
+            value = self._access_value(ref_name)
 
             # Convert to string
             return str(value)
@@ -367,45 +531,51 @@ class WiringRuntime(WiringBase, ThreadSafeMixin):
 class Accessor:
     """A callable object that retrieves a wired value."""
 
+    # No per-instance __dict__: one accessor exists per wired name and
+    # only ever holds these two references.
+    __slots__ = ("_wiring", "_name")
+
     def __init__(self, wiring: WiringRuntime, name: str) -> None:
         self._wiring = wiring
         self._name = name
 
     def __call__(self) -> object:
         """Return the wired object, instantiating it if necessary."""
-        # Fast path: EAFP pattern for cache lookup
-        # Try to get cached value directly (faster than check + get)
-        try:
-            return self._wiring._values[self._name]
-        except KeyError:
-            pass
-
-        # Not cached, so we need to instantiate it.
-        # We use _instantiate_attr which handles thread safety if enabled.
-        return self._wiring._instantiate_attr(
-            self._name, lambda: self._wiring._instantiate_impl(self._name)
-        )
+        return self._wiring._access_value(self._name)
 
 
 @final
 class AioAccessor:
     """Helper for accessing wired objects asynchronously."""
 
+    __slots__ = ("_wiring", "_accessors")
+
     def __init__(self, wiring: WiringRuntime) -> None:
         self._wiring = wiring
+        # One async callable per name: __getattr__ fires on every
+        # `wired.aio.name` lookup, and rebuilding the closure each time
+        # would allocate a fresh function object per access.
+        self._accessors: dict[str, Callable[[], Awaitable[object]]] = {}
 
     def __getattr__(self, name: str) -> Callable[[], Awaitable[object]]:
         """Return an async callable for the named wired object."""
-        # Read _wiring from __dict__ to avoid recursing through __getattr__
-        # if this accessor isn't fully initialized.
+        # Read slots via object.__getattribute__ to avoid recursing through
+        # __getattr__ if this accessor isn't fully initialized.
         try:
             wiring = cast(
                 WiringRuntime, object.__getattribute__(self, "_wiring")
             )
+            accessors = cast(
+                "dict[str, Callable[[], Awaitable[object]]]",
+                object.__getattribute__(self, "_accessors"),
+            )
         except AttributeError:
             raise AttributeError(
                 f"'{type(self).__name__}' object has no attribute '{name}'"
             ) from None
+        cached = accessors.get(name)
+        if cached is not None:
+            return cached
         # Check if valid name
         if name not in wiring._parsed and name not in wiring._values:
             raise AttributeError(
@@ -413,10 +583,15 @@ class AioAccessor:
                 f"'{name}'"
             )
 
+        values = wiring._values
+
         async def _get() -> object:
             # EAFP: Try cached value first
+            # `values` and `wiring` are captured from the enclosing
+            # __getattr__ frame: closure cell loads beat re-walking the
+            # self._wiring attribute chain on every await.
             try:
-                return self._wiring._values[name]
+                return values[name]
             except KeyError:
                 pass
 
@@ -425,11 +600,12 @@ class AioAccessor:
             loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 None,
-                lambda: self._wiring._instantiate_attr(
-                    name, lambda: self._wiring._instantiate_impl(name)
+                lambda: wiring._instantiate_attr(
+                    name, lambda: wiring._instantiate_impl(name)
                 ),
             )
 
+        accessors[name] = _get
         return _get
 
 
@@ -68,6 +68,14 @@ class ThreadSafeMixin:
         self._lock_retry_sleep = lock_retry_sleep
 
     def _get_attribute_lock(self, name: str) -> threading.RLock:
+        # Lock-free fast path: dict reads are GIL-atomic and a lock, once
+        # stored, is never replaced, so a hit needs no mutex traffic.
+        # Runtime containers preallocate every per-entry lock up front and
+        # always take this path; compiled containers fall through once per
+        # name to create the lock under _attr_locks_lock.
+        lock = self._attr_locks.get(name)
+        if lock is not None:
+            return lock
         with self._attr_locks_lock:
             if name not in self._attr_locks:
                 self._attr_locks[name] = threading.RLock()
@@ -77,9 +85,12 @@ class ThreadSafeMixin:
         return self._local.held_locks
 
     def _release_held_locks(self) -> None:
-        for lock in reversed(self._local.held_locks):
-            lock.release()
-        self._local.held_locks.clear()
+        # Pop from the tail: releases in reverse acquisition order (same as
+        # the reversed() iteration this replaces) and leaves the list empty
+        # without allocating an iterator or issuing a separate clear().
+        held = self._local.held_locks
+        while held:
+            held.pop().release()
 
     def _check_cache(self, name: str) -> tuple[bool, object | None]:
         """Check if attribute is cached, return (found, value) tuple.
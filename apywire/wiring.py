@@ -17,10 +17,12 @@ containers:
 from __future__ import annotations
 
 import re
+import sys
 from collections import deque
 from collections.abc import Iterable
+from functools import partial
 from types import EllipsisType
-from typing import NamedTuple, TypeAlias, cast
+from typing import Final, NamedTuple, TypeAlias, cast
 
 from apywire.constants import (
     CACHE_ATTR_PREFIX,
@@ -38,17 +40,58 @@ _ConstantValue: TypeAlias = (
     str | bytes | bool | int | float | complex | EllipsisType | None
 )
 
+# Exact types of atomic constant leaves (str excluded: strings may carry
+# placeholders). One frozenset membership test rejects the hottest leaf
+# case before any other dispatch.
+_ATOMIC_TYPES: Final[frozenset[type]] = frozenset(
+    {int, float, bool, bytes, complex, EllipsisType, type(None)}
+)
+
+
+def _interpolate_sub(
+    match: re.Match[str],
+    lookup: dict[str, "_RuntimeValue"],
+    context: str,
+) -> str:
+    """Substitution callback for `_interpolate_placeholders`.
+
+    Lives at module scope so each interpolation binds it with one
+    `functools.partial` instead of allocating a fresh closure (code
+    object cells plus function object) per call.
+    """
+    ref_name = match.group(1)
+    if ref_name not in lookup:
+        ctx_msg = f" in {context}" if context else ""
+        raise UnknownPlaceholderError(
+            f"Unknown placeholder '{ref_name}'{ctx_msg}"
+        )
+    ref_value = lookup[ref_name]
+    return str(ref_value) if not isinstance(ref_value, str) else ref_value
+
 
 class _WiredRef:
     """Marker for a value that references another wired attribute.
 
     Resolved lazily at instantiation.
+
+    Refs compare equal (and hash alike) when they point at the same
+    name, so two refs to ``{x}`` deduplicate inside sets and dict keys
+    of resolved containers.
+
+    Names are interned: every downstream ``_values``/``_parsed`` lookup
+    then compares by pointer identity instead of hashing characters.
     """
 
     __slots__ = ("name",)
 
     def __init__(self, name: str) -> None:
-        self.name = name
+        self.name = sys.intern(name)
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is _WiredRef and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
 
 
 class _AioWiredRef:
@@ -57,12 +100,14 @@ class _AioWiredRef:
     Unlike _WiredRef which resolves to the instantiated value,
     _AioWiredRef resolves to an async accessor callable.
     Used with ``{aio.name}`` placeholder syntax.
+
+    Names are interned for the same reason as `_WiredRef`.
     """
 
     __slots__ = ("name",)
 
     def __init__(self, name: str) -> None:
-        self.name = name
+        self.name = sys.intern(name)
 
 
 # User-provided spec values: primitives, containers, or placeholders
@@ -112,6 +157,10 @@ class _ParsedEntry(NamedTuple):
     class_name: str
     factory_method: str | None
     data: _ResolvedSpecMapping | str | _WiredRef
+    # False only when data is known to be placeholder-free, which lets
+    # instantiation skip the _resolve_runtime walk for the entry. True is
+    # the safe default: it merely keeps the traversal.
+    has_refs: bool = True
 
 
 class _UnresolvedParsedEntry(NamedTuple):
@@ -124,6 +173,15 @@ class _UnresolvedParsedEntry(NamedTuple):
     data: _SpecMapping
 
 
+# Memoized key-parse results shared across containers. Parsing is a pure
+# function of the key, so programs that rebuild the same spec repeatedly
+# (e.g. one container per request) pay the slicing and interning once per
+# distinct key. Plain dict get/set are GIL-atomic; the size guard below
+# keeps a pathological stream of unique keys from growing it unbounded.
+_PARSE_CACHE: dict[str, tuple[str, str, str, str | None] | None] = {}
+_PARSE_CACHE_MAX: Final[int] = 1024
+
+
 class SpecParser:
     """Base class for parsing wiring specs."""
 
@@ -133,6 +191,9 @@ class SpecParser:
     ) -> tuple[str, str, str, str | None] | None:
         """Parse a request string into components.
 
+        Results are memoized in `_PARSE_CACHE`; invalid keys raise
+        without being cached.
+
         Args:
             key: Entry string like "module.Class name" or
                    "module.Class name.factoryMethod"
@@ -142,17 +203,33 @@ class SpecParser:
             or None if the key is not a wired object definition
             (e.g. constant).
         """
-        if SPEC_KEY_DELIMITER not in key:
+        try:
+            return _PARSE_CACHE[key]
+        except KeyError:
+            pass
+
+        # Single rfind doubles as the membership test and the split point,
+        # so the key is scanned once instead of via `in` + rsplit.
+        delim_idx = key.rfind(SPEC_KEY_DELIMITER)
+        if delim_idx < 0:
+            if len(_PARSE_CACHE) < _PARSE_CACHE_MAX:
+                _PARSE_CACHE[key] = None
             return None
 
-        type_str, name_part = key.rsplit(SPEC_KEY_DELIMITER, 1)
-        parts = type_str.split(".")
-        module_name = ".".join(parts[:-1])
-        class_name = parts[-1]
+        type_str = key[:delim_idx]
+        name_part = key[delim_idx + len(SPEC_KEY_DELIMITER) :]
+
+        # Split module/class on the last dot without materializing the
+        # intermediate list that split('.') + join would allocate.
+        class_dot = type_str.rfind(".")
+        module_name = type_str[:class_dot] if class_dot >= 0 else ""
+        class_name = type_str[class_dot + 1 :]
 
-        if "." in name_part:
-            name, factory_method = name_part.split(".", 1)
-            if "." in factory_method:
+        factory_dot = name_part.find(".")
+        if factory_dot >= 0:
+            name = name_part[:factory_dot]
+            factory_method = name_part[factory_dot + 1 :]
+            if name_part.find(".", factory_dot + 1) >= 0:
                 raise ValueError(
                     f"invalid spec key '{key}': nested factory methods "
                     f"are not supported."
@@ -166,7 +243,18 @@ class SpecParser:
                 f"invalid spec key '{key}': missing module qualification"
             )
 
-        return module_name, class_name, name, factory_method
+        # Intern the sliced components: they are reused as dict keys and
+        # getattr arguments for the lifetime of the container, so key
+        # comparisons become pointer checks.
+        result = (
+            sys.intern(module_name),
+            sys.intern(class_name),
+            sys.intern(name),
+            sys.intern(factory_method) if factory_method else factory_method,
+        )
+        if len(_PARSE_CACHE) < _PARSE_CACHE_MAX:
+            _PARSE_CACHE[key] = result
+        return result
 
     @staticmethod
     def _validate_positional_keys(
@@ -257,6 +345,7 @@ class WiringBase(SpecParser):
 
     _parsed: dict[str, _ParsedEntry]
     _values: dict[str, _RuntimeValue]
+    _build_order: list[str]
 
     def __init__(
         self,
@@ -280,90 +369,99 @@ class WiringBase(SpecParser):
         self._max_lock_attempts = max_lock_attempts
         self._lock_retry_sleep = lock_retry_sleep
 
-        # Pre-parse all keys to correctly identify dependencies
-        # map: exposed_name -> (is_const, raw_value, parsed_entry_or_none)
-        all_entries: dict[
-            str, tuple[bool, _SpecValue, _UnresolvedParsedEntry | None]
-        ] = {}
+        # Pre-parse all keys and build the dependency graph in a single
+        # pass. Raw spec values are kept per exposed name; presence in
+        # parsed_entries distinguishes wired objects from constants (no
+        # per-entry tuple boxing/unpacking). Entries without a single '{'
+        # anywhere in their value cannot reference anything, so the regex
+        # dependency scan is skipped for them entirely.
+        raw_values: dict[str, _SpecValue] = {}
+        parsed_entries: dict[str, _UnresolvedParsedEntry] = {}
+        full_deps: dict[str, set[str]] = {}
 
         for key, value in spec.items():
             parsed_entry = self._parse_spec_entry(key, value)
             if parsed_entry:
-                all_entries[parsed_entry.name] = (False, value, parsed_entry)
+                name = parsed_entry.name
+                parsed_entries[name] = parsed_entry
             else:
-                all_entries[key] = (True, value, None)
-
-        # Build full dependency graph for early cycle detection
-        full_deps: dict[str, set[str]] = {}
-        for name, (_, entry_val, _) in all_entries.items():
-            deps = self._find_placeholder_names(entry_val)
-            full_deps[name] = deps
+                name = key
+            raw_values[name] = value
+            if self._has_placeholder(value):
+                full_deps[name] = self._find_placeholder_names(value)
+            else:
+                full_deps[name] = set()
 
         # Detect circular dependencies across ALL entries
         # This will raise CircularWiringError if a cycle exists.
         sorted_keys = self._topological_sort(full_deps)
+        # Dependency order of every exposed name. prebuild() walks it so
+        # each entry is built only after everything it references is
+        # already cached.
+        self._build_order: list[str] = sorted_keys
 
-        # Now proceed with separation and processing
+        # Separate wired entries from constants, classifying constants by
+        # their (already computed) placeholder deps in the same sweep.
         parsed: list[_UnresolvedParsedEntry] = []
-        consts: dict[str, _SpecValue] = {}
+        raw_consts: dict[str, _SpecValue] = {}
+        const_with_refs: dict[str, tuple[_SpecValue, set[str]]] = {}
 
-        # Separation based on the pre-parsed results
         for name in sorted_keys:
             # keys in sorted_keys are 'exposed names'
-            # we need to find the original entry to process
-            is_const, entry_val, entry = all_entries[name]
-            if not is_const and entry:
+            entry = parsed_entries.get(name)
+            if entry is not None:
                 parsed.append(entry)
+                continue
+            deps = full_deps[name]
+            if deps:
+                const_with_refs[name] = (raw_values[name], deps)
             else:
-                consts[name] = entry_val
-
-        # Parse wired objects
-        self._parsed: dict[str, _ParsedEntry] = {
-            entry.name: _ParsedEntry(
+                raw_consts[name] = raw_values[name]
+
+        # Parse wired objects. Values without any '{' cannot contain
+        # placeholders, so _resolve would just rebuild an identical
+        # structure — reuse the original data for those entries and mark
+        # them has_refs=False so instantiation skips the runtime walk too.
+        self._parsed: dict[str, _ParsedEntry] = {}
+        for entry in parsed:
+            if self._has_placeholder(entry.data):
+                data = cast(_ResolvedSpecMapping, self._resolve(entry.data))
+                has_refs = True
+            else:
+                data = cast(_ResolvedSpecMapping, entry.data)
+                has_refs = False
+            self._parsed[entry.name] = _ParsedEntry(
                 entry.module_name,
                 entry.class_name,
                 entry.factory_method,
-                cast(_ResolvedSpecMapping, self._resolve(entry.data)),
+                data,
+                has_refs,
             )
-            for entry in parsed
-        }
 
-        # Handle constants
-        # Classify constants by placeholder type using ALREADY calculated deps
-        raw_consts: dict[str, _SpecValue] = {}
-        const_with_refs: dict[str, tuple[_SpecValue, set[str]]] = {}
-
-        for key, const_val in consts.items():
-            # REUSE full_deps[key] which we already computed!
-            placeholder_names = full_deps[key]
-            if not placeholder_names:
-                raw_consts[key] = const_val
-            else:
-                const_with_refs[key] = (const_val, placeholder_names)
+        # Promote constants to accessors if they reference wired objects.
+        # Promotion is transitive (a constant referencing a promoted
+        # constant is itself promoted), i.e. reachability from the wired
+        # entries through reverse placeholder edges. A single BFS visits
+        # each edge once — O(V+E) instead of the repeated full rescans of
+        # a while-changed fixpoint loop.
+        reverse_refs: dict[str, list[str]] = {}
+        to_promote: set[str] = set()
+        promote_queue: deque[str] = deque()
 
-        # Promote constants to accessors if they reference wired objects:
-        # Transitive promotion logic remains...
-        const_deps_graph: dict[str, set[str]] = {
-            key: placeholder_names
-            for key, (val_entry, placeholder_names) in const_with_refs.items()
-        }
-
-        to_promote = set()
-        # Initial set: constants ref wired objects directly
         for key, (_, placeholder_names) in const_with_refs.items():
+            # Seed: constants that reference wired objects directly
             if any(name in self._parsed for name in placeholder_names):
                 to_promote.add(key)
+                promote_queue.append(key)
+            for dep in placeholder_names:
+                reverse_refs.setdefault(dep, []).append(key)
 
-        # Propagate promotion
-        changed = True
-        while changed:
-            changed = False
-            for key, deps in const_deps_graph.items():
-                if key in to_promote:
-                    continue
-                if any(dep in to_promote for dep in deps):
-                    to_promote.add(key)
-                    changed = True
+        while promote_queue:
+            promoted = promote_queue.popleft()
+            for dependent in reverse_refs.get(promoted, []):
+                if dependent not in to_promote:
+                    to_promote.add(dependent)
+                    promote_queue.append(dependent)
 
         # Split into promoted and pure-constant refs
         const_with_const_refs: dict[str, _SpecValue] = {}
@@ -440,30 +538,121 @@ class WiringBase(SpecParser):
                _is_placeholder first)
 
         Returns:
-            The placeholder name without braces
+            The placeholder name without braces (interned, since it is
+            used as a lookup key downstream)
+        """
+        return sys.intern(
+            s.removeprefix(PLACEHOLDER_START).removesuffix(PLACEHOLDER_END)
+        )
+
+    def _resolve_leaf(self, s: str) -> str | _WiredRef | _AioWiredRef:
+        """Resolve a single string leaf to a marker or itself.
+
+        A single ``fullmatch`` against the compiled placeholder regex
+        both detects and captures the name in one C call (replacing the
+        startswith/endswith/strip sequence). Strings that are not
+        exactly one placeholder — including templates like
+        ``"{a} {b}"`` — pass through unchanged.
         """
-        return s.removeprefix(PLACEHOLDER_START).removesuffix(PLACEHOLDER_END)
+        m = PLACEHOLDER_REGEX.fullmatch(s)
+        if m is None:
+            return s
+        ref_name = sys.intern(m.group(1))
+        if ref_name.startswith("aio."):
+            return _AioWiredRef(ref_name[4:])
+        return _WiredRef(ref_name)
 
     def _resolve(self, obj: _SpecValue) -> _ResolvedValue:
         """Resolve placeholders into `_WiredRef` markers for runtime.
 
         Replaces strings of the form "{name}" with a `_WiredRef(name)`
         and "{aio.name}" with a `_AioWiredRef(name)` for later resolution.
+
+        Dispatches on exact ``type(obj)``: spec values are plain
+        builtins, so one identity comparison per node replaces the
+        chained isinstance MRO walks, with atomic leaves (int, None,
+        bool, ...) falling straight through. Containers are rebuilt
+        with an explicit work stack rather than recursion, so deeply
+        nested specs cost no Python frames per level: every container
+        gets a pre-sized list shadow filled by slot index, and dict/
+        tuple shadows are converted back (deepest first) once their
+        children are complete.
         """
-        if isinstance(obj, str):
-            if self._is_placeholder(obj):
-                ref_name = self._extract_placeholder_name(obj)
-                if ref_name.startswith("aio."):
-                    return _AioWiredRef(ref_name[4:])
-                return _WiredRef(ref_name)
+        t = type(obj)
+        if t in _ATOMIC_TYPES:
+            return cast(_ConstantValue, obj)
+        if t is str:
+            return self._resolve_leaf(cast(str, obj))
+        # isinstance (not exact type) so container subclasses such as
+        # OrderedDict enter the walk and get their placeholders resolved.
+        if not isinstance(obj, (dict, list, tuple)):
             return obj
-        elif isinstance(obj, dict):
-            return {k: self._resolve(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._resolve(v) for v in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self._resolve(v) for v in obj)
-        return obj
+
+        root: list[_ResolvedValue] = [None]
+        stack: list[tuple[_SpecValue, list[_ResolvedValue], int]] = [
+            (obj, root, 0)
+        ]
+        # Deferred conversions: (parent, slot, shadow, keys) where keys
+        # is the ordered key tuple for dicts and None for tuples.
+        fixups: list[
+            tuple[
+                list[_ResolvedValue],
+                int,
+                list[_ResolvedValue],
+                tuple[str | int, ...] | None,
+            ]
+        ] = []
+
+        while stack:
+            src, parent, slot = stack.pop()
+            t = type(src)
+            if t in _ATOMIC_TYPES:
+                parent[slot] = cast(_ConstantValue, src)
+            elif t is str:
+                parent[slot] = self._resolve_leaf(cast(str, src))
+            elif t is dict:
+                d = cast("dict[str | int, _SpecValue]", src)
+                shadow: list[_ResolvedValue] = [None] * len(d)
+                fixups.append((parent, slot, shadow, tuple(d.keys())))
+                stack.extend((v, shadow, i) for i, v in enumerate(d.values()))
+            elif t is list:
+                ls = cast("list[_SpecValue]", src)
+                shadow = [None] * len(ls)
+                parent[slot] = shadow
+                stack.extend((v, shadow, i) for i, v in enumerate(ls))
+            elif t is tuple:
+                tp = cast("tuple[_SpecValue, ...]", src)
+                shadow = [None] * len(tp)
+                fixups.append((parent, slot, shadow, None))
+                stack.extend((v, shadow, i) for i, v in enumerate(tp))
+            elif isinstance(src, dict):
+                # Exact-type misses: container subclasses (rare) are
+                # rebuilt as plain containers so their placeholders still
+                # resolve; anything else is an opaque constant leaf.
+                shadow = [None] * len(src)
+                fixups.append((parent, slot, shadow, tuple(src.keys())))
+                stack.extend(
+                    (v, shadow, i) for i, v in enumerate(src.values())
+                )
+            elif isinstance(src, list):
+                shadow = [None] * len(src)
+                parent[slot] = shadow
+                stack.extend((v, shadow, i) for i, v in enumerate(src))
+            elif isinstance(src, tuple):
+                shadow = [None] * len(src)
+                fixups.append((parent, slot, shadow, None))
+                stack.extend((v, shadow, i) for i, v in enumerate(src))
+            else:
+                parent[slot] = src
+
+        # Shadows were recorded top-down, so the reverse order finishes
+        # children before the containers that hold them.
+        for parent, slot, shadow, keys in reversed(fixups):
+            if keys is None:
+                parent[slot] = tuple(shadow)
+            else:
+                parent[slot] = dict(zip(keys, shadow))
+        return root[0]
 
     def _interpolate_placeholders(
         self,
@@ -484,20 +673,40 @@ class WiringBase(SpecParser):
         Raises:
             UnknownPlaceholderError: If placeholder name not in lookup
         """
+        # Fast path: nothing to substitute in brace-free templates.
+        if PLACEHOLDER_START not in template:
+            return template
 
-        def replace_placeholder(match: re.Match[str]) -> str:
-            ref_name = match.group(1)
-            if ref_name not in lookup:
-                ctx_msg = f" in {context}" if context else ""
-                raise UnknownPlaceholderError(
-                    f"Unknown placeholder '{ref_name}'{ctx_msg}"
-                )
-            ref_value = lookup[ref_name]
-            return (
-                str(ref_value) if not isinstance(ref_value, str) else ref_value
-            )
+        return PLACEHOLDER_REGEX.sub(
+            partial(_interpolate_sub, lookup=lookup, context=context),
+            template,
+        )
+
+    def _has_placeholder(self, obj: _SpecValue) -> bool:
+        """Cheaply check whether a value could contain a placeholder.
 
-        return PLACEHOLDER_REGEX.sub(replace_placeholder, template)
+        Walks the value with an explicit stack and returns True on the
+        first string containing a ``{`` character. No regex and no set
+        building, so pure-constant entries are rejected at the cost of a
+        few string scans.
+
+        Args:
+            obj: Value to scan
+
+        Returns:
+            True if any nested string contains a placeholder start marker
+        """
+        stack: list[_SpecValue] = [obj]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                if PLACEHOLDER_START in item:
+                    return True
+            elif isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+        return False
 
     def _find_placeholder_names(self, obj: _SpecValue) -> set[str]:
         """Find all placeholder names referenced in a value.
@@ -513,6 +722,10 @@ class WiringBase(SpecParser):
         """
         names: set[str] = set()
         if isinstance(obj, str):
+            # C-level byte scan first: most string leaves have no brace at
+            # all, so skip the regex engine entirely for them.
+            if PLACEHOLDER_START not in obj:
+                return names
             # Find all placeholders in the string (embedded or not)
             matches: list[str] = PLACEHOLDER_REGEX.findall(obj)
             for match in matches:
@@ -543,12 +756,19 @@ class WiringBase(SpecParser):
             CircularWiringError: If circular dependencies detected
         """
         # Calculate in-degree (number of dependencies) for each node and
-        # build the reverse adjacency (dependents-of) map in a single pass.
+        # build the reverse adjacency (dependents-of) map in a single pass,
+        # so the main loop below visits each edge exactly once: O(n + m)
+        # overall rather than rescanning every node per dequeue.
         # Dependents are appended in node-iteration order, so a node's list
         # preserves the original dict insertion order and the dequeue order
         # below stays identical to a per-node rescan of ``dependencies``.
+        # (graphlib.TopologicalSorter was considered and rejected: its
+        # static_order() does not guarantee this insertion-order tie-break,
+        # which compiled output determinism depends on.)
         all_nodes = set(dependencies.keys())
-        in_degree: dict[str, int] = {}
+        # fromkeys builds the hash table at its final size in one C call,
+        # so the assignments below never trigger a resize.
+        in_degree: dict[str, int] = dict.fromkeys(dependencies, 0)
         dependents: dict[str, list[str]] = {node: [] for node in dependencies}
         for node, deps in dependencies.items():
             # Filter to only dependencies within this set
@@ -575,8 +795,11 @@ class WiringBase(SpecParser):
 
         # If we couldn't process all nodes, there's a cycle
         if len(result) != len(dependencies):
-            # Find nodes in cycle for error message
-            unprocessed = [n for n in dependencies if n not in result]
+            # Find nodes in cycle for error message. Every processed node
+            # ends with in-degree zero, so the leftover nodes are exactly
+            # those with a positive count — an O(n) scan instead of the
+            # quadratic `n not in result` list-membership test.
+            unprocessed = [n for n, d in in_degree.items() if d > 0]
 
             # Delegate construction of a helpful exception to the
             # CircularWiringError helper to keep concerns separated.
@@ -605,7 +828,17 @@ class WiringBase(SpecParser):
         Raises:
             UnknownPlaceholderError: If placeholder references unknown constant
         """
+        if type(value) in _ATOMIC_TYPES:
+            return cast(_ConstantValue, value)
         if isinstance(value, str):
+            # Brace-free strings (the common case) need no placeholder
+            # handling at all — return them without further dispatch.
+            # str.format_map was considered for the template case below
+            # but rejected: its field grammar (format specs after ':',
+            # '{{' escaping, no spaces in names) diverges from
+            # PLACEHOLDER_PATTERN, which allows any non-brace content.
+            if PLACEHOLDER_START not in value:
+                return value
             # Check if the entire string is a single placeholder
             if self._is_placeholder(value):
                 ref_name = self._extract_placeholder_name(value)
@@ -629,7 +862,11 @@ class WiringBase(SpecParser):
                 for k, v in value.items()
             }
         elif isinstance(value, list):
-            return [self._resolve_constant(v, resolved) for v in value]
+            # Pre-size the output to skip list-growth reallocations.
+            out: list[_RuntimeValue] = [None] * len(value)
+            for i, v in enumerate(value):
+                out[i] = self._resolve_constant(v, resolved)
+            return out
         elif isinstance(value, tuple):
             return tuple(self._resolve_constant(v, resolved) for v in value)
         return value
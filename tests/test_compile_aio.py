@@ -198,11 +198,13 @@ def test_aio_compile_constructor_args_source() -> None:
             class Compiled:
 
                 def birthday(self):
-                    if not hasattr(self, "_birthday"):
+                    try:
+                        return self._birthday
+                    except AttributeError:
                         self._birthday = datetime.datetime(
                             day=25, month=12, year=1990
                         )
-                    return self._birthday
+                        return self._birthday
 
                 @cached_property
                 def aio(self):
@@ -253,17 +255,12 @@ def test_aio_compiled_constant_not_run_in_executor(
     compiled = execd["compiled"]
 
     class DummyLoop:
-        def run_in_executor(
-            self, *args: object, **kwargs: object
-        ) -> object:
+        def run_in_executor(self, *args: object, **kwargs: object) -> object:
             raise AssertionError(
-                "run_in_executor should not be called"
-                " for constants"
+                "run_in_executor should not be called" " for constants"
             )
 
-    monkeypatch.setattr(
-        aio_mod, "get_running_loop", lambda: DummyLoop()
-    )
+    monkeypatch.setattr(aio_mod, "get_running_loop", lambda: DummyLoop())
 
     async def get() -> int:
         return await cast(Awaitable[int], compiled.aio.myConst())
@@ -257,9 +257,7 @@ def test_instantiate_attr_exception_releases_nested_locks() -> None:
     assert _lock_free_for_other_thread(container, "ok")
 
 
-def _lock_free_for_other_thread(
-    container: MockContainer, name: str
-) -> bool:
+def _lock_free_for_other_thread(container: MockContainer, name: str) -> bool:
     """Return True if `name`'s per-attribute lock is acquirable elsewhere.
 
     Probes from a separate thread because RLock is reentrant: the calling
@@ -317,6 +315,48 @@ def test_compile_constant_aio() -> None:
     assert "CompiledAio" in code
 
 
+def test_compile_promoted_template_trailing_literal() -> None:
+    """Test promoted templates keep literal text after the last ref."""
+    from apywire import Spec, WiringCompiler
+
+    spec: Spec = {
+        "datetime.date d": {"year": 2025, "month": 1, "day": 1},
+        "msg": "{d}!",
+    }
+    code = WiringCompiler(spec, thread_safe=False).compile()
+    # The f-string starts at the placeholder and ends with the literal.
+    assert "str(self.d())" in code
+    assert "!'" in code
+
+
+def test_compile_promoted_container_thread_safe() -> None:
+    """Test thread-safe compile of a promoted non-string constant."""
+    from apywire import Spec, WiringCompiler
+
+    spec: Spec = {
+        "datetime.date d": {"year": 2025, "month": 1, "day": 1},
+        "lst": ["{d}"],
+    }
+    code = WiringCompiler(spec, thread_safe=True).compile(thread_safe=True)
+    # Non-string promoted data renders through _expr_source and is
+    # wrapped in the thread-safe instantiation helper.
+    assert "self._instantiate_attr('lst', lambda: [self.d()])" in code
+
+
+def test_compile_skips_values_shadowed_by_parsed_entries() -> None:
+    """Test compile() emits one accessor when a cache entry shadows a
+    spec entry."""
+    from apywire import Spec, WiringCompiler
+
+    spec: Spec = {"datetime.date d": {"year": 2025, "month": 1, "day": 1}}
+    w = WiringCompiler(spec, thread_safe=False)
+    # Simulate a stale cached value for a wired name: the parsed
+    # accessor wins and no duplicate constant accessor is emitted.
+    w._values["d"] = 1
+    code = w.compile(aio=True)
+    assert code.count("def d(self):") == 1
+
+
 def test_compile_aio_threaded_full_output() -> None:
     """Test full compiled output for aio=True and thread_safe=True."""
     from textwrap import dedent
@@ -354,14 +394,16 @@ def test_compile_aio_threaded_full_output() -> None:
                 self._init_thread_safety()
 
             def birthday(self):
-                if not hasattr(self, "_birthday"):
+                try:
+                    return self._birthday
+                except AttributeError:
                     self._birthday = self._instantiate_attr(
                         "birthday",
                         lambda: datetime.datetime(
                             day=25, month=12, year=1990
                         ),
                     )
-                return self._birthday
+                    return self._birthday
 
             @cached_property
             def aio(self):
@@ -528,8 +570,18 @@ def test_aio_accessor_unknown_attribute() -> None:
         asyncio.run(get_unknown())
 
 
-def test_compile_ast_recursion_call_tuple() -> None:
-    """Test _astify recursion into Call args and Tuple."""
+def test_aio_accessor_caches_closure_per_name() -> None:
+    """Test AioAccessor returns the same callable on repeated lookups."""
+    from apywire import Spec, Wiring
+
+    wired = Wiring(cast(Spec, {"myConst": 1}), thread_safe=False)
+    # The second lookup must hit the per-name cache, not rebuild the
+    # closure.
+    assert wired.aio.myConst is wired.aio.myConst
+
+
+def test_compile_recursion_call_tuple() -> None:
+    """Test compile() recursion into nested tuple/list arguments."""
     import sys
     from types import ModuleType
 
@@ -547,7 +599,7 @@ def test_compile_ast_recursion_call_tuple() -> None:
             "ast_rec.func caller": {"x": ["{leaf}"]},  # List
             "ast_rec.func leaf": {},
         }
-        # _astify recurses on Call, Dict, List, Tuple nodes.
+        # The source renderer recurses through call args and containers.
 
         code = WiringCompiler(spec, thread_safe=False).compile(aio=True)
 
@@ -730,3 +782,39 @@ def test_underscore_prefixed_wired_name_still_accessible() -> None:
         assert wired._hidden() is inst
     finally:
         del sys.modules["mod_underscore_name"]
+
+
+def test_compile_non_finite_constants_roundtrip() -> None:
+    """Non-finite constants must compile to source that parses back."""
+    import math
+    from typing import Protocol
+
+    import apywire
+
+    spec: apywire.Spec = {
+        "posInf": float("inf"),
+        "negInf": float("-inf"),
+        "notANum": float("nan"),
+        "cplx": complex(float("-inf"), float("nan")),
+    }
+    code = apywire.WiringCompiler(spec, thread_safe=False).compile()
+    # A bare repr would emit inf/-inf/nan, which exec as unbound names;
+    # the generated source must spell them as constructor calls.
+    assert 'float("inf")' in code
+    assert 'float("nan")' in code
+
+    class NonFiniteProto(Protocol):
+        def posInf(self) -> float: ...
+        def negInf(self) -> float: ...
+        def notANum(self) -> float: ...
+        def cplx(self) -> complex: ...
+
+    execd: dict[str, NonFiniteProto] = {}
+    exec(code, execd)
+    compiled = execd["compiled"]
+    assert compiled.posInf() == float("inf")
+    assert compiled.negInf() == float("-inf")
+    assert math.isnan(compiled.notANum())
+    value = compiled.cplx()
+    assert value.real == float("-inf")
+    assert math.isnan(value.imag)
@@ -323,10 +323,7 @@ class TestNumericKeyConversion:
     def test_leading_zero_keys_stay_strings(self) -> None:
         """Keys with leading zeros must not be converted."""
         spec = toml_to_spec(
-            '["myapp.Config cfg"]\n'
-            '00 = "a"\n'
-            '01 = "b"\n'
-            '0 = "c"\n'
+            '["myapp.Config cfg"]\n' '00 = "a"\n' '01 = "b"\n' '0 = "c"\n'
         )
         entry = spec["myapp.Config cfg"]
         assert isinstance(entry, dict)
@@ -2,8 +2,6 @@
 #
 # SPDX-License-Identifier: ISC
 
-import ast
-
 import apywire
 from apywire.wiring import _ResolvedValue, _WiredRef
 
@@ -23,6 +21,143 @@ def test_resolve_string_and_tuple_returning_expected_types() -> None:
     assert resolved[2] == 1
 
 
+def test_resolve_handles_deep_nesting_without_recursion() -> None:
+    w = apywire.Wiring({}, thread_safe=False)
+    # Build a list nested far beyond the default recursion limit; the
+    # stack-based walk must rebuild it without blowing Python's stack.
+    depth = 5000
+    nested: list[object] = ["{ref}"]
+    for _ in range(depth):
+        nested = [nested]
+    from typing import cast
+
+    from apywire.wiring import _SpecValue
+
+    resolved = w._resolve(cast(_SpecValue, nested))
+    for _ in range(depth):
+        assert isinstance(resolved, list) and len(resolved) == 1
+        resolved = resolved[0]
+    assert isinstance(resolved, list)
+    assert isinstance(resolved[0], _WiredRef)
+    assert resolved[0].name == "ref"
+
+
+def test_resolve_leaf_requires_exact_single_placeholder() -> None:
+    w = apywire.Wiring({}, thread_safe=False)
+    assert isinstance(w._resolve_leaf("{a}"), _WiredRef)
+    # Multi-placeholder strings are templates, not single refs.
+    assert w._resolve_leaf("{a} {b}") == "{a} {b}"
+    assert w._resolve_leaf("prefix {a}") == "prefix {a}"
+    assert w._resolve_leaf("{}") == "{}"
+
+
+def test_wiredref_equality_and_hash_follow_name() -> None:
+    # Refs to the same name are interchangeable in sets and dict keys.
+    assert _WiredRef("a") == _WiredRef("a")
+    assert _WiredRef("a") != _WiredRef("b")
+    assert _WiredRef("a") != "a"
+    assert len({_WiredRef("a"), _WiredRef("a"), _WiredRef("b")}) == 2
+
+
+def test_has_placeholder_detects_braces_in_nested_values() -> None:
+    w = apywire.Wiring({}, thread_safe=False)
+    # Plain constants (including nested containers) are rejected cheaply.
+    assert w._has_placeholder("plain") is False
+    assert w._has_placeholder(42) is False
+    assert w._has_placeholder(["a", ("b", 1), {"k": None}]) is False
+    # Any nested string with a '{' is a potential placeholder.
+    assert w._has_placeholder("{ref}") is True
+    assert w._has_placeholder(["a", ("b", "{ref}")]) is True
+    assert w._has_placeholder({"k": {"nested": "{ref}"}}) is True
+
+
+def test_resolve_runtime_handles_deep_nesting_without_recursion() -> None:
+    w = apywire.Wiring({}, thread_safe=False)
+    w._values["ref"] = 42
+    depth = 5000
+    nested: list[object] = [_WiredRef("ref")]
+    for _ in range(depth):
+        nested = [nested]
+    from typing import cast
+
+    from apywire.wiring import _ResolvedValue
+
+    resolved = w._resolve_runtime(cast(_ResolvedValue, nested))
+    for _ in range(depth):
+        assert isinstance(resolved, list) and len(resolved) == 1
+        resolved = resolved[0]
+    assert isinstance(resolved, list)
+    assert isinstance(resolved[0], int) and resolved[0] == 42
+
+
+def test_resolve_runtime_returns_constant_subtrees_by_reference() -> None:
+    w = apywire.Wiring({}, thread_safe=False)
+    w._values["ref"] = 1
+    constant_branch = {"k": [1, 2, (3,)]}
+    data = {"const": constant_branch, "wired": _WiredRef("ref")}
+    from typing import cast
+
+    from apywire.wiring import _ResolvedValue
+
+    resolved = w._resolve_runtime(cast(_ResolvedValue, data))
+    assert isinstance(resolved, dict)
+    resolved_map = cast("dict[str | int, object]", resolved)
+    # Marker-free branches are shared, not copied.
+    assert resolved_map["const"] is constant_branch
+    assert resolved_map["wired"] == 1
+
+
+def test_resolve_runtime_shares_marker_free_nested_containers() -> None:
+    from typing import cast
+
+    w = apywire.Wiring({}, thread_safe=False)
+    w._values["ref"] = 9
+    const_list = [1, 2]
+    const_tuple = (3, 4)
+    data = [_WiredRef("ref"), const_list, const_tuple]
+    resolved = w._resolve_runtime(cast("_ResolvedValue", data))
+    assert isinstance(resolved, list)
+    resolved_items = cast("list[object]", resolved)
+    assert resolved_items[0] == 9
+    # Marker-free siblings of a ref are shared, not rebuilt.
+    assert resolved_items[1] is const_list
+    assert resolved_items[2] is const_tuple
+    # A fully marker-free container is handed back by reference too.
+    assert w._resolve_runtime(cast("_ResolvedValue", const_list)) is const_list
+
+
+def test_instantiate_impl_returns_cached_values_without_parsing() -> None:
+    w = apywire.Wiring({}, thread_safe=False)
+    w._values["hit"] = 7
+    # Cached names short-circuit before any spec lookup.
+    assert w._instantiate_impl("hit") == 7
+
+
+def test_resolve_runtime_unknown_aio_ref_raises() -> None:
+    import pytest
+
+    from apywire.exceptions import UnknownPlaceholderError
+    from apywire.wiring import _AioWiredRef
+
+    w = apywire.Wiring({}, thread_safe=False)
+    with pytest.raises(UnknownPlaceholderError, match="nope"):
+        w._resolve_runtime(_AioWiredRef("nope"), context="owner")
+
+
+def test_interpolate_placeholders_returns_brace_free_templates() -> None:
+    w = apywire.Wiring({}, thread_safe=False)
+    # Brace-free templates skip the regex pass entirely.
+    assert w._interpolate_placeholders("plain", {}) == "plain"
+
+
+def test_getattr_reuses_one_accessor_per_name() -> None:
+    w = apywire.Wiring({"myConst": 1}, thread_safe=False)
+    # Accessor objects are cached per name, not rebuilt on every miss.
+    first = w.myConst
+    assert w.myConst is first
+    assert first() == 1
+
+
 def test_resolve_runtime_tuple_resolves_wiredrefs_to_values() -> None:
     w = apywire.Wiring({}, thread_safe=False)
     # Put a value in _values so getattr doesn't need to import
@@ -35,31 +170,12 @@ def test_resolve_runtime_tuple_resolves_wiredrefs_to_values() -> None:
     assert isinstance(runtime_value[1], int) and runtime_value[1] == 5
 
 
-def test_astify_tuple_and_fallback_to_constant() -> None:
+def test_expr_source_renders_tuples_with_refs_and_constants() -> None:
     w = apywire.WiringCompiler({}, thread_safe=False)
-    # Tuple containing WiredRef, string, and int should return ast.Tuple
-    node = w._astify((_WiredRef("x"), "s", 1))
-    assert isinstance(node, ast.Tuple)
-    assert len(node.elts) == 3
-    assert isinstance(node.elts[0], ast.Call)
-    # The call should be `self.x()` so the callee is an Attribute
-    assert isinstance(node.elts[0].func, ast.Attribute)
-    assert isinstance(node.elts[1], ast.Constant)
-    assert isinstance(node.elts[2], ast.Constant)
-
-    # For an arbitrary object, ast.Constant should be returned
-    class Dummy:
-        pass
-
-    d = Dummy()
-    # We're intentionally testing the fallback behavior with an invalid type
-    from typing import cast
-
-    const_node = w._astify(cast(_ResolvedValue, d))
-    assert isinstance(const_node, ast.Constant)
-    # ast.Constant.value is typed as a union of constant types, but we're
-    # testing the fallback behavior, so we cast to object for the check
-    assert cast(object, const_node.value) is d
+    # Refs render as accessor calls, constants as their repr.
+    assert w._expr_source((_WiredRef("x"), "s", 1)) == "(self.x(), 's', 1)"
+    # One-element tuples keep the trailing comma so they parse back.
+    assert w._expr_source((1,)) == "(1,)"
 
 
 def test_topological_sort_orders_dependencies_first() -> None:
@@ -95,3 +211,125 @@ def test_topological_sort_raises_on_cycle() -> None:
     w = apywire.Wiring({}, thread_safe=False)
     with pytest.raises(CircularWiringError):
         w._topological_sort({"a": {"b"}, "b": {"a"}})
+
+
+def test_resolve_fast_paths_return_atomics_unchanged() -> None:
+    from typing import cast
+
+    from apywire.wiring import _SpecValue
+
+    w = apywire.Wiring({}, thread_safe=False)
+    # Atomic leaves short-circuit before any container dispatch.
+    assert w._resolve(42) == 42
+    assert w._resolve(None) is None
+    # Values that are neither atomic, string nor container pass through
+    # untouched (e.g. a pre-built object used as a constant).
+    opaque = {1, 2}
+    assert cast(object, w._resolve(cast("_SpecValue", opaque))) is opaque
+
+
+def test_resolve_constant_fast_paths_return_values_unchanged() -> None:
+    from typing import cast
+
+    from apywire.wiring import _SpecValue
+
+    w = apywire.Wiring({}, thread_safe=False)
+    # Atomic values and brace-free strings skip placeholder handling.
+    assert w._resolve_constant(42, {}) == 42
+    assert w._resolve_constant("plain", {}) == "plain"
+    # Non-container, non-string leftovers fall through unchanged.
+    opaque = {1, 2}
+    assert w._resolve_constant(cast("_SpecValue", opaque), {}) is opaque
+
+
+def test_resolve_handles_container_subclasses() -> None:
+    from collections import OrderedDict
+    from typing import cast
+
+    from apywire.wiring import _SpecValue
+
+    w = apywire.Wiring({}, thread_safe=False)
+    # Subclass containers are rebuilt as plain containers with their
+    # placeholders resolved, same as the isinstance-based walks.
+    od: "OrderedDict[str | int, object]" = OrderedDict({"ref": "{target}"})
+    resolved = w._resolve(cast("_SpecValue", od))
+    assert type(resolved) is dict
+    ref = resolved["ref"]
+    assert isinstance(ref, _WiredRef)
+    assert ref.name == "target"
+
+    class ListSub(list["_SpecValue"]):
+        pass
+
+    nested = ListSub(["{a}", cast("_SpecValue", od)])
+    resolved_list = w._resolve(nested)
+    assert type(resolved_list) is list
+    assert isinstance(resolved_list[0], _WiredRef)
+    inner = resolved_list[1]
+    assert type(inner) is dict
+    assert isinstance(inner["ref"], _WiredRef)
+
+
+def test_resolve_rebuilds_tuple_subclasses_and_keeps_opaque_leaves() -> None:
+    from typing import cast
+
+    from apywire.wiring import _SpecValue
+
+    w = apywire.Wiring({}, thread_safe=False)
+
+    class TupleSub(tuple["_SpecValue", ...]):
+        pass
+
+    opaque = {1, 2}
+    nested = ["{a}", TupleSub(("{b}", 1)), cast("_SpecValue", opaque)]
+    resolved = w._resolve(cast("_SpecValue", nested))
+    assert isinstance(resolved, list)
+    # Tuple subclasses are rebuilt as plain tuples with refs resolved.
+    inner = resolved[1]
+    assert type(inner) is tuple
+    assert isinstance(inner[0], _WiredRef) and inner[0].name == "b"
+    assert inner[1] == 1
+    # Non-container leaves are carried over by reference.
+    assert cast(object, resolved[2]) is opaque
+
+
+def test_expr_source_renders_ellipsis_and_container_subclasses() -> None:
+    from collections import OrderedDict
+    from typing import cast
+
+    w = apywire.WiringCompiler({}, thread_safe=False)
+    assert w._expr_source(...) == "..."
+    # Subclass containers render as plain literals, mirroring _resolve.
+    od: "OrderedDict[str | int, _ResolvedValue]" = OrderedDict(
+        {"k": _WiredRef("x")}
+    )
+    assert w._expr_source(cast("_ResolvedValue", od)) == "{'k': self.x()}"
+
+    class ListSub(list["_ResolvedValue"]):
+        pass
+
+    assert w._expr_source(ListSub([1, _WiredRef("y")])) == "[1, self.y()]"
+
+    class TupleSub(tuple["_ResolvedValue", ...]):
+        pass
+
+    assert w._expr_source(TupleSub((1,))) == "(1,)"
+    assert w._expr_source(TupleSub((1, 2))) == "(1, 2)"
+
+
+def test_expr_source_raises_for_unrenderable_objects() -> None:
+    from typing import cast
+
+    import pytest
+
+    from apywire.exceptions import WiringError
+
+    w = apywire.WiringCompiler({}, thread_safe=False)
+
+    class Opaque:
+        pass
+
+    # repr() of an arbitrary object cannot round-trip through source;
+    # compiling must fail instead of emitting a broken module.
+    with pytest.raises(WiringError, match="cannot render"):
+        w._expr_source(cast(_ResolvedValue, Opaque()))
@@ -70,11 +70,13 @@ def test_simple_compile_constructor_args() -> None:
             class Compiled:
 
                 def birthday(self):
-                    if not hasattr(self, "_birthday"):
+                    try:
+                        return self._birthday
+                    except AttributeError:
                         self._birthday = datetime.datetime(
                             day=25, month=12, year=1990
                         )
-                    return self._birthday
+                        return self._birthday
 
 
             compiled = Compiled()
@@ -148,9 +150,11 @@ def test_deep_module_paths() -> None:
             class Compiled:
 
                 def someModule(self):
-                    if not hasattr(self, "_someModule"):
+                    try:
+                        return self._someModule
+                    except AttributeError:
                         self._someModule = foo.bar.baz.bat.SomeClass()
-                    return self._someModule
+                        return self._someModule
 
 
             compiled = Compiled()
@@ -210,11 +214,13 @@ def test_compile_constants_and_references() -> None:
             class Compiled:
 
                 def yearsAgo(self):
-                    if not hasattr(self, "_yearsAgo"):
+                    try:
+                        return self._yearsAgo
+                    except AttributeError:
                         self._yearsAgo = datetime.datetime(
                             day=13, month=12, year=self.myYearValue()
                         )
-                    return self._yearsAgo
+                        return self._yearsAgo
 
                 def myYearValue(self):
                     return 2003
@@ -258,11 +264,13 @@ def test_compile_inlines_mutated_values() -> None:
             class Compiled:
 
                 def yearsAgo(self):
-                    if not hasattr(self, "_yearsAgo"):
+                    try:
+                        return self._yearsAgo
+                    except AttributeError:
                         self._yearsAgo = datetime.datetime(
                             day=13, month=12, year=self.myYearValue()
                         )
-                    return self._yearsAgo
+                        return self._yearsAgo
 
                 def myYearValue(self):
                     return 1999
@@ -307,14 +315,18 @@ def test_compile_uses_self_for_non_constants() -> None:
             class Compiled:
 
                 def other(self):
-                    if not hasattr(self, "_other"):
+                    try:
+                        return self._other
+                    except AttributeError:
                         self._other = mymod.SomeClass()
-                    return self._other
+                        return self._other
 
                 def wrapper(self):
-                    if not hasattr(self, "_wrapper"):
+                    try:
+                        return self._wrapper
+                    except AttributeError:
                         self._wrapper = mymod.Wrapper(child=self.other())
-                    return self._wrapper
+                        return self._wrapper
 
 
             compiled = Compiled()
@@ -775,3 +787,19 @@ def test_unknown_placeholder_exception_during_creation() -> None:
     finally:
         if "mymod_err" in sys.modules:
             del sys.modules["mymod_err"]
+
+
+def test_prebuild_instantiates_every_entry_eagerly() -> None:
+    spec: apywire.Spec = {
+        "datetime.timedelta delta": {"days": 1},
+        "datetime.datetime when": {"year": 2000, "month": 1, "day": 1},
+        "greeting": "hello",
+    }
+    wired: apywire.Wiring = apywire.Wiring(spec, thread_safe=False)
+    wired.prebuild()
+    # Every wired entry is cached, and later accessor calls return the
+    # prebuilt instances rather than constructing new ones.
+    assert "delta" in wired._values
+    assert "when" in wired._values
+    assert wired.when() is wired._values["when"]
+    assert wired.greeting() == "hello"
@@ -828,3 +828,15 @@ def test_optimistic_mode_cleanup() -> None:
     assert container._local.mode is None
     assert container._get_held_locks() == []
     assert result == "test"
+
+
+def test_attribute_locks_preallocated_for_every_entry() -> None:
+    spec: apywire.Spec = {
+        "datetime.timedelta delta": {"days": 1},
+        "datetime.datetime when": {"year": 2000, "month": 1, "day": 1},
+    }
+    wired: apywire.Wiring = apywire.Wiring(spec, thread_safe=True)
+    # Every parsed entry gets its lock at construction time, so the hot
+    # path in _get_attribute_lock never takes the creation mutex.
+    assert set(wired._attr_locks) == {"delta", "when"}
+    assert wired._get_attribute_lock("delta") is wired._attr_locks["delta"]